@@ -1,32 +1,39 @@
 #!/usr/bin/env python3
 
-import argparse
-import base64
-import datetime
-import json
+# Modules only needed by some commands (base64, concurrent.futures, datetime,
+# http.client, json, subprocess, webbrowser) are imported where they are
+# used, so that each invocation only pays for loading what it needs; the
+# TYPE_CHECKING block below only binds names for the annotations.
+from __future__ import annotations
+
+import functools
 import logging
 import os
 import re
-import subprocess
+import select
 import sys
-import urllib.request
-import webbrowser
+import threading
+import time
+import urllib.parse
 from dataclasses import dataclass
 from pathlib import Path
-from urllib.error import HTTPError
+from typing import TYPE_CHECKING, cast
 
 import tomllib
 
+if TYPE_CHECKING:
+    import concurrent.futures
+    import http.client
+
 """
 CONFIG
 Settings file, logging setup, etc.
 """
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 try:
-    with open(Path.home() / ".config/usa.toml") as f:
-        config = tomllib.loads(f.read())
+    with open(Path.home() / ".config/usa.toml", "rb") as f:
+        config = tomllib.load(f)
 except FileNotFoundError:
     sys.stdout.write(
         "Could not find configuration file. Please copy the config.sample.toml file "
@@ -34,20 +41,60 @@ except FileNotFoundError:
     )
     sys.exit(1)
 
+# Responses to GET requests are cached on disk for this many seconds
+CACHE_DIR = Path.home() / ".cache/usa"
+CACHE_TTL = config.get("cache_ttl", 120)
+
 # Words that are removed from search matching as they are insignificant
-STOP_WORDS = ["all", "just", "being", "over", "both", "through", "yourselves", "its", "before", "herself", "had", "should", "to", "only", "under", "ours", "has", "do", "them", "his", "very", "they", "not", "during", "now", "him", "nor", "did", "this", "she", "each", "further", "where", "few", "because", "doing", "some", "are", "our", "ourselves", "out", "what", "for", "while", "does", "above", "between", "t", "be", "we", "who", "were", "here", "hers", "by", "on", "about", "of", "against", "s", "or", "own", "into", "yourself", "down", "your", "from", "her", "their", "there", "been", "whom", "too", "themselves", "was", "until", "more", "himself", "that", "but", "don", "with", "than", "those", "he", "me", "myself", "these", "up", "will", "below", "can", "theirs", "my", "and", "then", "is", "am", "it", "an", "as", "itself", "at", "have", "in", "any", "if", "again", "no", "when", "same", "how", "other", "which", "you", "after", "most", "such", "why", "a", "off", "i", "yours", "so", "the", "having", "once"]  # fmt: skip
+STOP_WORDS = frozenset({"all", "just", "being", "over", "both", "through", "yourselves", "its", "before", "herself", "had", "should", "to", "only", "under", "ours", "has", "do", "them", "his", "very", "they", "not", "during", "now", "him", "nor", "did", "this", "she", "each", "further", "where", "few", "because", "doing", "some", "are", "our", "ourselves", "out", "what", "for", "while", "does", "above", "between", "t", "be", "we", "who", "were", "here", "hers", "by", "on", "about", "of", "against", "s", "or", "own", "into", "yourself", "down", "your", "from", "her", "their", "there", "been", "whom", "too", "themselves", "was", "until", "more", "himself", "that", "but", "don", "with", "than", "those", "he", "me", "myself", "these", "up", "will", "below", "can", "theirs", "my", "and", "then", "is", "am", "it", "an", "as", "itself", "at", "have", "in", "any", "if", "again", "no", "when", "same", "how", "other", "which", "you", "after", "most", "such", "why", "a", "off", "i", "yours", "so", "the", "having", "once"})  # fmt: skip
 
 """
 ISSUES
 Branch parsing, regex, webbrowser.
 """
 
+# Issue id prefixed to the branch name, e.g. ISSUE-123-implement-widget
+ISSUE_ID_RE = re.compile(r"(\D+-\d+)")
+
 
 class GitException(Exception):
     pass
 
 
+def git_dir() -> Path | None:
+    """
+    Find the .git directory of the repo containing the current working
+    directory. Worktrees and submodules have a .git file pointing to it.
+    """
+    cwd = Path(os.getcwd())
+    for d in (cwd, *cwd.parents):
+        dot_git = d / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        elif dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir: "):
+                return d / content.removeprefix("gitdir: ")
+            return None
+    return None
+
+
+# The branch can't change during a run, so it is only looked up once
+@functools.lru_cache(maxsize=1)
 def git_branch() -> str:
+    # Reading HEAD directly is much faster than running git. Anything out of
+    # the ordinary (GIT_DIR, detached HEAD, reftable repos) is left to git.
+    gd = None if "GIT_DIR" in os.environ else git_dir()
+    if gd is not None:
+        try:
+            head = (gd / "HEAD").read_text().strip()
+        except OSError:
+            head = ""
+        branch_name = head.removeprefix("ref: refs/heads/")
+        if branch_name != head and branch_name != ".invalid":
+            return branch_name
+    import subprocess
+
     try:
         p = subprocess.run(
             ["git", "branch", "--show-current"],
@@ -63,7 +110,7 @@ def git_branch() -> str:
 
 
 def extract_issue_id(branch: str) -> str | None:
-    result = re.search(r"^(\D+-\d+)", branch)
+    result = ISSUE_ID_RE.match(branch)
     if not result:
         return None
     else:
@@ -71,6 +118,8 @@ def extract_issue_id(branch: str) -> str | None:
 
 
 def open_issue(issue_id: str):
+    import webbrowser
+
     webbrowser.open_new_tab(f"{config["jira_url"]}/browse/{issue_id}")
 
 
@@ -84,54 +133,253 @@ class JiraClientError(Exception):
     pass
 
 
-class JiraAPIClient:
-    def __init__(self) -> None:
-        try:
-            self.base_url = config["jira_url"]
-        except IndexError:
-            raise JiraClientError("jira_url missing from config.")
+def basic_auth(username: str, password: str) -> str:
+    import base64
+
+    auth_str = f"{username}:{password}"
+    b64_auth_str = base64.b64encode(auth_str.encode("utf-8"))
+    return f"Basic {b64_auth_str.decode("utf-8")}"
+
+
+# Statuses Jira returns when it is overloaded or restarting
+RETRY_STATUSES = {502, 503, 504}
+
+# Open connections to Jira, keyed by base url. Kept for the lifetime of the
+# process so consecutive API calls reuse the same TCP/TLS session. Connections
+# can't be shared between threads so every thread gets its own.
+_connections = threading.local()
 
-        try:
-            self.username = config["email"]
-            self.token = config["api_token"]
-        except IndexError:
-            raise JiraClientError("email and/or api_token missing from config.")
 
-    def auth_header(self) -> str:
-        auth_str = f"{self.username}:{self.token}"
-        b64_auth_str = base64.b64encode(auth_str.encode("utf-8"))
-        decoded = b64_auth_str.decode("utf-8")
-        return f"Basic {decoded}"
+class JiraAPIClient:
+    def __init__(self) -> None:
+        missing = [k for k in ("jira_url", "email", "api_token") if k not in config]
+        if missing:
+            raise JiraClientError(f"{", ".join(missing)} missing from config.")
+
+        self.base_url = config["jira_url"]
+        self.url = urllib.parse.urlsplit(self.base_url)
+        # Prepended to endpoints, for Jira instances not served from the root
+        self.path_prefix = self.url.path.rstrip("/")
+        self.username = config["email"]
+        self.token = config["api_token"]
+        self.auth_header = basic_auth(self.username, self.token)
+
+        # Proxy set in the environment (https_proxy, no_proxy etc.), if any
+        self.proxy = self.find_proxy()
+        self.proxy_headers = {}
+        if self.proxy is not None and self.proxy.username:
+            self.proxy_headers["Proxy-Authorization"] = basic_auth(
+                urllib.parse.unquote(self.proxy.username),
+                urllib.parse.unquote(self.proxy.password or ""),
+            )
+        if self.proxy is not None and self.url.scheme == "http":
+            # Plain http requests are sent to the proxy with the full url
+            self.path_prefix = f"http://{self.url.netloc}{self.path_prefix}"
+
+    def find_proxy(self) -> urllib.parse.SplitResult | None:
+        import urllib.request
+
+        if urllib.request.proxy_bypass(self.url.hostname):
+            return None
+        proxy = urllib.request.getproxies().get(self.url.scheme)
+        if not proxy:
+            return None
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        proxy_url = urllib.parse.urlsplit(proxy)
+        if not proxy_url.hostname:
+            raise JiraClientError(f"Proxy {proxy} has no host name.")
+        return proxy_url
+
+    def connection(self) -> http.client.HTTPConnection:
+        import http.client
+
+        if not hasattr(_connections, "by_url"):
+            _connections.by_url = {}
+        conn = _connections.by_url.get(self.base_url)
+        if conn is None:
+            conn_class: type[http.client.HTTPConnection]
+            if self.url.scheme == "http":
+                conn_class = http.client.HTTPConnection
+            else:
+                conn_class = http.client.HTTPSConnection
+            if self.proxy is None:
+                conn = conn_class(self.url.netloc, timeout=30)
+            else:
+                # find_proxy only returns proxies that have a host name
+                proxy_host = cast(str, self.proxy.hostname)
+                proxy_port = self.proxy.port or 80
+                conn = conn_class(proxy_host, proxy_port, timeout=30)
+                if self.url.scheme == "https":
+                    # https is tunneled through the proxy with CONNECT
+                    conn.set_tunnel(self.url.netloc, headers=self.proxy_headers)
+            _connections.by_url[self.base_url] = conn
+        return conn
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        body: bytes | None = None,
+        headers: dict | None = None,
+        follow_redirects: bool = True,
+    ) -> http.client.HTTPResponse:
+        """
+        Send a request over the shared keep-alive connection. The response
+        must be read in full before the next request is made.
+        """
+        import http.client
+
+        logger.debug("Making call to %s%s", self.base_url, endpoint)
+        path = self.path_prefix + endpoint
+        headers = {
+            "Accept": "application/json",
+            "Authorization": self.auth_header,
+            **(headers or {}),
+        }
+        if self.proxy is not None and self.url.scheme == "http":
+            headers.update(self.proxy_headers)
+        conn = self.connection()
+        # GETs are retried with backoff when Jira is briefly unavailable
+        delays = [0.3, 0.6, 1.2] if method == "GET" else []
+        while True:
+            # An idle keep-alive connection has nothing to read unless Jira
+            # closed it, in which case start over with a fresh one.
+            if conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+                conn.close()
+            # A kept-alive connection may still be closed by Jira at any moment
+            reused = conn.sock is not None
+            try:
+                conn.request(method, path, body, headers)
+            except (ConnectionResetError, BrokenPipeError):
+                # Jira can't have acted on a request it didn't fully receive,
+                # so it is safe to send it again on a fresh connection.
+                conn.close()
+                if not reused:
+                    raise
+                conn.request(method, path, body, headers)
+            try:
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError):
+                conn.close()
+                # The request may have been processed, only resend GETs.
+                if not reused or method != "GET":
+                    raise
+                conn.request(method, path, body, headers)
+                response = conn.getresponse()
+            if response.status not in RETRY_STATUSES or not delays:
+                break
+            response.read()
+            delay = delays.pop(0)
+            logger.debug(
+                "Got HTTP %s from Jira, retrying in %ss", response.status, delay
+            )
+            time.sleep(delay)
+        if 300 <= response.status < 400:
+            response.read()
+            location = response.getheader("Location", "")
+            prefix = self.url.path.rstrip("/")
+            target = urllib.parse.urlsplit(
+                urllib.parse.urljoin(f"{self.base_url.rstrip("/")}{endpoint}", location)
+            )
+            # Only GETs that stay on the same site are followed, and only once
+            if (
+                method == "GET"
+                and follow_redirects
+                and target[:2] == self.url[:2]
+                and target.path.startswith(f"{prefix}/")
+            ):
+                endpoint = target.path.removeprefix(prefix)
+                if target.query:
+                    endpoint += f"?{target.query}"
+                return self.request(method, endpoint, body, headers, False)
+            logger.error("Got HTTP %s from Jira.", response.status)
+            raise JiraClientError(
+                f"jira_url redirects to {location}, update your config."
+            )
+        if not 200 <= response.status < 300:
+            logger.error("Got HTTP %s from Jira.", response.status)
+            error = response.read().decode("utf-8", errors="replace")
+            raise JiraClientError(error or f"Got HTTP {response.status} from Jira.")
+        return response
 
     def post_json(self, endpoint: str, data: dict) -> dict:
-        logger.debug("Making call to %s", self.base_url + endpoint)
-        req = urllib.request.Request(self.base_url + endpoint)
-        req.add_header("Content-Type", "application/json; charset=utf-8")
-        req.add_header("Authorization", self.auth_header())
+        import json
+
         json_data = json.dumps(data)
         bytes_data = json_data.encode("utf-8")
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        response = self.request("POST", endpoint, bytes_data, headers)
+        if response.length == 0:
+            # e.g. 204 No Content, read it anyway to free up the connection
+            response.read()
+            return {}
         try:
-            response = urllib.request.urlopen(req, bytes_data)
-            body = response.read()
-            if len(body.decode()) > 1:
-                return json.loads(body.decode())
-            else:
-                return {}
-        except HTTPError as e:
-            logger.exception("Got HTTPError from Jira.")
-            raise JiraClientError(e.read().decode())
-
-    def get_json(self, endpoint: str) -> dict:
-        logger.debug("Making call to %s", self.base_url + endpoint)
-        req = urllib.request.Request(self.base_url + endpoint)
-        req.add_header("Authorization", self.auth_header())
+            return json.load(response)
+        except json.JSONDecodeError:
+            # An empty chunked body has no length to check up front
+            return {}
+
+    def get_json(self, endpoint: str, use_cache: bool = True) -> dict:
+        import json
+
+        path = self.cache_path(endpoint)
         try:
-            response = urllib.request.urlopen(req)
-            body = response.read()
-            return json.loads(body.decode())
-        except HTTPError as e:
-            logger.exception("Got HTTPError from Jira.")
-            raise JiraClientError(e.read().decode())
+            if use_cache and time.time() - path.stat().st_mtime < CACHE_TTL:
+                logger.debug("Using cached response for %s", endpoint)
+                return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            # A truncated or unreadable entry is dropped and fetched again
+            logger.debug("Discarding unreadable cached response for %s", endpoint)
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+        response = self.request("GET", endpoint)
+        body = response.read()
+        result = json.loads(body)
+        # Only cache what parsed as JSON, so a bad response isn't replayed
+        if use_cache and CACHE_TTL > 0 and response.status == 200:
+            try:
+                path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                tmp_path = path.with_name(path.name + ".tmp")
+                tmp_path.write_bytes(body)
+                tmp_path.replace(path)
+            except OSError:
+                logger.debug("Could not cache response for %s", endpoint)
+        return result
+
+    def cache_path(self, endpoint: str) -> Path:
+        # Keyed by account too, as what Jira returns depends on who is asking
+        account = urllib.parse.quote(self.username, safe="@")
+        return (
+            CACHE_DIR
+            / self.url.netloc
+            / account
+            / urllib.parse.quote(endpoint, safe="")
+        )
+
+    def invalidate_cache(self, endpoint: str):
+        """
+        Remove cached responses for the endpoint and everything below it,
+        e.g. an issue and its comments and transitions.
+        """
+        name = self.cache_path(endpoint).name
+        try:
+            cached = list(self.cache_path(endpoint).parent.iterdir())
+        except FileNotFoundError:
+            return
+        for path in cached:
+            if path.name == name or path.name.startswith((name + "%2F", name + "%3F")):
+                path.unlink(missing_ok=True)
+
+
+@functools.cache
+def get_client() -> JiraAPIClient:
+    """Return the JiraAPIClient shared by the whole process."""
+    return JiraAPIClient()
 
 
 """
@@ -139,38 +387,52 @@ COMMENTS
 """
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Comment:
+    id: str
     email: str
-    date: str
+    date_formatted: str
     body: str
 
     def __str__(self) -> str:
-        date = datetime.datetime.fromisoformat(self.date)
-        formatted_d = date.strftime("%B %-d, %Y at %-I:%M %p")
-        return f"{self.email:<30}{formatted_d}\n{self.body}\n\n"
+        return f"{self.email:<30}{self.date_formatted}\n{self.body}\n\n"
+
+
+def format_date(iso_date: str) -> str:
+    import datetime
+
+    date = datetime.datetime.fromisoformat(iso_date)
+    # Not using %-d and %-I as those are not supported on Windows
+    hour = date.hour % 12 or 12
+    return f"{date:%B} {date.day}, {date:%Y} at {hour}:{date:%M %p}"
+
+
+def parse_comment(c: dict) -> Comment:
+    return Comment(
+        id=c["id"],
+        email=c["author"].get("emailAddress", ""),
+        date_formatted=format_date(c["created"]),
+        body=c["body"],
+    )
 
 
 def parse_comments_response(resp: dict) -> list[Comment]:
-    return [
-        Comment(
-            email=c["author"].get("emailAddress", ""), date=c["created"], body=c["body"]
-        )
-        for c in resp["comments"]
-    ]
+    return [parse_comment(c) for c in resp["comments"]]
 
 
-def add_comment(issue_id: str, body: str) -> dict:
-    client = JiraAPIClient()
+def add_comment(issue_id: str, body: str) -> Comment:
+    client = get_client()
     endpoint = f"/rest/api/latest/issue/{issue_id}/comment"
     data = {"body": body}
-    return client.post_json(endpoint, data)
+    result = client.post_json(endpoint, data)
+    client.invalidate_cache(f"/rest/api/latest/issue/{issue_id}")
+    return parse_comment(result)
 
 
-def get_comments(issue_id: str) -> list[Comment]:
-    client = JiraAPIClient()
+def get_comments(issue_id: str, use_cache: bool = True) -> list[Comment]:
+    client = get_client()
     endpoint = f"/rest/api/latest/issue/{issue_id}/comment"
-    all_comments = client.get_json(endpoint)
+    all_comments = client.get_json(endpoint, use_cache=use_cache)
     return parse_comments_response(all_comments)
 
 
@@ -179,7 +441,7 @@ TRANSITIONS
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     id: int
     name: str
@@ -193,17 +455,18 @@ def parse_transitions_response(resp: dict) -> list[Transition]:
 
 
 def get_available_transitions(issue_id: str) -> list[Transition]:
-    client = JiraAPIClient()
+    client = get_client()
     endpoint = f"/rest/api/latest/issue/{issue_id}/transitions"
     all_transitions = client.get_json(endpoint)
     return parse_transitions_response(all_transitions)
 
 
 def do_transition(issue_id: str, transition: int):
-    client = JiraAPIClient()
+    client = get_client()
     endpoint = f"/rest/api/latest/issue/{issue_id}/transitions"
     data = {"transition": {"id": transition}}
     client.post_json(endpoint, data)
+    client.invalidate_cache(f"/rest/api/latest/issue/{issue_id}")
 
 
 """
@@ -211,11 +474,11 @@ SEARCHING
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueSearch:
     id: str
     summary: str
-    description: str
+    description: str | None
     assignee: str | None
     status: str
     comments: list[Comment]
@@ -235,12 +498,16 @@ def parse_search_response(resp: dict) -> list[IssueSearch]:
             assignee = i["fields"]["assignee"].get("emailAddress", "n/a")
         else:
             assignee = ""
-        comments = parse_comments_response(i["fields"]["comment"])
+        # description and comment are only present if they were requested
+        if "comment" in i["fields"]:
+            comments = parse_comments_response(i["fields"]["comment"])
+        else:
+            comments = []
         issues.append(
             IssueSearch(
                 id=i["key"],
                 summary=i["fields"]["summary"],
-                description=i["fields"]["description"],
+                description=i["fields"].get("description"),
                 assignee=assignee,
                 status=i["fields"]["status"]["name"],
                 comments=comments,
@@ -259,9 +526,10 @@ def issues_for_directory() -> list[str]:
     issues = []
     if not projects:
         return []
-    for d in projects.keys():
-        if Path(d) in Path(os.getcwd()).parents:
-            issues += projects[d]
+    parents = set(Path(os.getcwd()).parents)
+    for d, ids in projects.items():
+        if Path(d) in parents:
+            issues.extend(ids)
     return issues
 
 
@@ -270,8 +538,8 @@ def get_parent_issue_id(issue_id: str) -> str | None:
     Return the parent issue id (used to be called epic link)
     for a given issue id,
     """
-    client = JiraAPIClient()
-    endpoint = f"/rest/api/latest/issue/{issue_id}"
+    client = get_client()
+    endpoint = f"/rest/api/latest/issue/{issue_id}?fields=parent"
     result = client.get_json(endpoint)
     try:
         return result["fields"]["parent"]["key"]
@@ -283,36 +551,43 @@ def determine_parent_issues(issue_id: str) -> list[str]:
     """
     Given an issue, figure out what it's parent issue IDs are
     either by checking the config file or looking up via API.
+    Returns an empty list if there are none.
     """
     # Check config for issue mapping for the current directory
     parent_issues = issues_for_directory()
     if len(parent_issues) < 1:
         # See if the current issue has a parent issue and use that
         parent_issue = get_parent_issue_id(issue_id)
-        if parent_issue is None:
-            sys.stdout.write("Could not determine any parent issues.")
-            sys.exit(1)
-        else:
+        if parent_issue is not None:
             parent_issues = [parent_issue]
     return parent_issues
 
 
-def do_jql_search(jql: str) -> list[IssueSearch]:
-    client = JiraAPIClient()
+# Fields needed to list issues, and the extra ones needed to show search matches
+LIST_FIELDS = ["summary", "status", "assignee"]
+SEARCH_FIELDS = LIST_FIELDS + ["description", "comment"]
+
+
+def do_jql_search(jql: str, fields: list[str] = SEARCH_FIELDS) -> list[IssueSearch]:
+    client = get_client()
     data = {
         "jql": jql,
-        "fields": ["summary", "description", "status", "assignee", "comment"],
+        "fields": fields,
         "maxResults": 100,
     }
     endpoint = "/rest/api/latest/search/"
     result = client.post_json(endpoint, data)
-    return list(reversed(parse_search_response(result)))
+    # Jira returns the newest issues first so that those are the ones kept
+    # when hitting maxResults, but they are displayed newest last.
+    issues = parse_search_response(result)
+    issues.reverse()
+    return issues
 
 
 def issues_by_parents(parents: list[str]) -> list[IssueSearch]:
     """Gets a list of issues filtered by the given issue IDs"""
     jql = f"parent IN ({",".join(parents)}) order by created DESC"
-    return do_jql_search(jql)
+    return do_jql_search(jql, fields=LIST_FIELDS)
 
 
 def issues_by_search_term(term: str, parents: list[str] = []) -> list[IssueSearch]:
@@ -323,24 +598,42 @@ def issues_by_search_term(term: str, parents: list[str] = []) -> list[IssueSearc
     return do_jql_search(jql)
 
 
+NON_WORD_RE = re.compile(r"\W+")
+# Maps every ASCII character not matched by \w to a space
+ASCII_NON_WORD = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
+
+
 def clean_string(string: str) -> str:
-    return re.sub(r"\W+", " ", string).strip().lower()
+    if string.isascii():
+        # Much faster than the regex, which is only needed for unicode text
+        return " ".join(string.translate(ASCII_NON_WORD).split()).lower()
+    return NON_WORD_RE.sub(" ", string).strip().lower()
 
 
 def display_matched_sections(issues: list[IssueSearch], search: str):
-    terms = set(clean_string(search).split(" ")) - set(STOP_WORDS)
+    terms = frozenset(clean_string(search).split(" ")) - STOP_WORDS
+    # A single alternation scans each text once instead of once per term.
+    terms_re = re.compile("|".join(map(re.escape, terms))) if terms else None
+
+    def matches(text: str | None) -> bool:
+        return bool(terms_re and text and terms_re.search(clean_string(text)))
+
     for issue in issues:
-        sys.stdout.write(f"\n--{issue.id}--\n")
-        sys.stdout.write(f"{'Assignee':.<15}{issue.assignee or "not assigned"}\n")
-        sys.stdout.write(f"{'Status':.<15}{issue.status}\n")
-        sys.stdout.write(f"{'Summary':.<15}{issue.summary}\n")
-        if any(
-            [t in clean_string(issue.description) for t in terms if issue.description]
-        ):
-            sys.stdout.write(f"\nDescription:\n{issue.description}\n")
+        # Written out once per issue rather than once per line
+        parts = [
+            f"\n--{issue.id}--\n",
+            f"{'Assignee':.<15}{issue.assignee or "not assigned"}\n",
+            f"{'Status':.<15}{issue.status}\n",
+            f"{'Summary':.<15}{issue.summary}\n",
+        ]
+        if matches(issue.description):
+            parts.append(f"\nDescription:\n{issue.description}\n")
         for comment in issue.comments:
-            if any([t in clean_string(comment.body) for t in terms if comment.body]):
-                sys.stdout.write(f"\nComment by {comment.email}:\n{comment.body}\n")
+            if matches(comment.body):
+                parts.append(f"\nComment by {comment.email}:\n{comment.body}\n")
+        sys.stdout.write("".join(parts))
 
 
 """
@@ -348,44 +641,68 @@ MAIN
 Main entrypoint, argument parsing.
 """
 
-parser = argparse.ArgumentParser(description="Scripts for working with Atlassian JIRA.")
-parser.add_argument(
-    "-i", "--issue", help="Issue id. Defaults to parsing from active Git branch."
-)
-parser.add_argument("-c", "--comment", help="Add a comment to the issue.")
-parser.add_argument(
-    "--list-comments", action="store_true", help="Display comments for an issue."
-)
-parser.add_argument(
-    "-o", "--open", action="store_true", help="Open the issue in a web browser."
-)
-parser.add_argument(
-    "-t",
-    "--transition",
-    action="store_true",
-    help="Transition the issue's state (e.g Backlog -> In Progress)",
-)
-parser.add_argument(
-    "-l",
-    "--list-issues",
-    action="store_true",
-    help="Display sibling issues.",
-)
-parser.add_argument(
-    "--plain",
-    action="store_true",
-    help="Display plain output and do not prompt for additional input.",
-)
-parser.add_argument("-s", "--search", help="Do a free-form search through all issues.")
-parser.add_argument(
-    "--restrict",
-    action="store_true",
-    help="Restrict a search to sibling issues. Has no meaning outside --search.",
-)
-args = parser.parse_args()
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+
+def in_background(fn, *fn_args) -> concurrent.futures.Future:
+    """Run fn(*fn_args) on a thread pool shared by the whole process."""
+    global _executor
+    import concurrent.futures
+
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    return _executor.submit(fn, *fn_args)
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Scripts for working with Atlassian JIRA."
+    )
+    parser.add_argument(
+        "-i", "--issue", help="Issue id. Defaults to parsing from active Git branch."
+    )
+    parser.add_argument("-c", "--comment", help="Add a comment to the issue.")
+    parser.add_argument(
+        "--list-comments", action="store_true", help="Display comments for an issue."
+    )
+    parser.add_argument(
+        "-o", "--open", action="store_true", help="Open the issue in a web browser."
+    )
+    parser.add_argument(
+        "-t",
+        "--transition",
+        action="store_true",
+        help="Transition the issue's state (e.g Backlog -> In Progress)",
+    )
+    parser.add_argument(
+        "-l",
+        "--list-issues",
+        action="store_true",
+        help="Display sibling issues.",
+    )
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="Display plain output and do not prompt for additional input.",
+    )
+    parser.add_argument(
+        "-s", "--search", help="Do a free-form search through all issues."
+    )
+    parser.add_argument(
+        "--restrict",
+        action="store_true",
+        help="Restrict a search to sibling issues. Has no meaning outside --search.",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Log calls made to the JIRA API."
+    )
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG)
+
     if len(sys.argv) < 2:
         parser.print_usage()
         sys.exit(1)
@@ -403,35 +720,65 @@ def main():
     else:
         issue_id = args.issue
 
+    # Independent requests are started up front and run in the background
+    # while the steps that come before them in the output are handled.
+    transitions_future = None
+    if args.transition and args.comment:
+        transitions_future = in_background(get_available_transitions, issue_id)
+
+    # Parent issues are only looked up in the background when there is a
+    # comment or transition step to overlap with, otherwise the lookup and
+    # the search that follows it share the main thread's connection.
+    parent_issues_future = None
+    if (args.list_issues or (args.search and args.restrict)) and (
+        args.comment or args.transition
+    ):
+        parent_issues_future = in_background(determine_parent_issues, issue_id)
+
+    @functools.cache
+    def parent_issues() -> list[str]:
+        if parent_issues_future is not None:
+            parent_issues = parent_issues_future.result()
+        else:
+            parent_issues = determine_parent_issues(issue_id)
+        if not parent_issues:
+            sys.stdout.write("Could not determine any parent issues.")
+            sys.exit(1)
+        return parent_issues
+
     if args.comment:
-        add_comment(issue_id, args.comment)
-        comments = get_comments(issue_id)
-        for comment in comments:
-            sys.stdout.write(str(comment))
+        # Fetch the existing comments while the new one is being posted. The
+        # fetch may or may not see the new comment, so it skips the cache and
+        # the comment Jira returns from the post is added if missing.
+        comments_future = in_background(get_comments, issue_id, False)
+        new_comment = add_comment(issue_id, args.comment)
+        comments = comments_future.result()
+        if new_comment.id not in {c.id for c in comments}:
+            comments.append(new_comment)
+        sys.stdout.write("".join(map(str, comments)))
 
     if args.list_comments:
         comments = get_comments(issue_id)
-        for comment in comments:
-            sys.stdout.write(str(comment))
+        sys.stdout.write("".join(map(str, comments)))
 
     if args.transition:
-        transitions = get_available_transitions(issue_id)
-        sys.stdout.write("Available states to transition to:\n")
-        for transition in transitions:
-            sys.stdout.write(str(transition) + "\n")
+        if transitions_future is not None:
+            transitions = transitions_future.result()
+        else:
+            transitions = get_available_transitions(issue_id)
+        lines = [f"{transition}\n" for transition in transitions]
+        sys.stdout.write("Available states to transition to:\n" + "".join(lines))
         transition_id = int(input("Enter state id: "))
         do_transition(issue_id, transition_id)
         sys.stdout.write("Success.")
 
     if args.list_issues:
-        parent_issues = determine_parent_issues(issue_id)
-        issues = issues_by_parents(parent_issues)
-        for idx, issue in enumerate(issues):
-            line = f"{idx:>3} {str(issue)}"
-            sys.stdout.write(line)
+        issues = issues_by_parents(parent_issues())
+        lines = [f"{idx:>3} {str(issue)}" for idx, issue in enumerate(issues)]
+        sys.stdout.write("".join(lines))
         if not args.plain:
             sys.stdout.write(
-                f"\nFound {len(issues)} issues for parent issue(s): {", ".join(parent_issues)}\n"
+                f"\nFound {len(issues)} issues for parent issue(s): {", ".join(parent_issues())}\n"
             )
             if len(issues) == 100:
                 sys.stdout.write(
@@ -445,8 +792,7 @@ def main():
 
     if args.search:
         if args.restrict:
-            parent_issues = determine_parent_issues(issue_id)
-            issues = issues_by_search_term(args.search, parents=parent_issues)
+            issues = issues_by_search_term(args.search, parents=parent_issues())
         else:
             issues = issues_by_search_term(args.search)
         display_matched_sections(issues, args.search)